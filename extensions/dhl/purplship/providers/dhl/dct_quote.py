@@ -1,6 +1,7 @@
 import time
-from functools import reduce
+from decimal import Decimal
 from typing import List, Tuple, cast, Iterable
+from lxml.etree import XPath
 from pydhl.dct_req_global_2_0 import (
     DCTRequest,
     DCTTo,
@@ -29,13 +30,22 @@ from purplship.providers.dhl.units import (
 from purplship.providers.dhl.utils import Settings
 from purplship.providers.dhl.error import parse_error_response
 
+_PRODUCTS = tuple((product.value, product.name) for product in Product)
+_NAMESPACE_DEF = (
+    'xmlns:p="http://www.dhl.com" xmlns:p1="http://www.dhl.com/datatypes" xmlns:p2="http://www.dhl.com/DCTRequestdatatypes" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.dhl.com DCT-req.xsd "'
+)
+_SHIPPING_CHARGE_XPATH = XPath(
+    "./*[local-name() = 'ShippingCharge']/text()", smart_strings=False
+)
+
 
 def parse_dct_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    qtdshp_list = response.xpath(".//*[local-name() = $name]", name="QtdShp")
     quotes: List[RateDetails] = [
-        _extract_quote(qtdshp_node, settings) for qtdshp_node in qtdshp_list
+        _extract_quote(qtdshp_node, settings)
+        for qtdshp_node in response.iter("{*}QtdShp")
+        if _SHIPPING_CHARGE_XPATH(qtdshp_node)
     ]
     return (
         [quote for quote in quotes if quote is not None],
@@ -49,27 +59,28 @@ def _extract_quote(qtdshp_node: Element, settings: Settings) -> RateDetails:
     if qtdshp.ShippingCharge is None or qtdshp.ShippingCharge == 0:
         return None
 
-    ExtraCharges = list(
-        map(
-            lambda s: ChargeDetails(
-                name=s.LocalServiceTypeName, amount=decimal(s.ChargeValue or 0)
-            ),
-            qtdshp.QtdShpExChrg,
+    ExtraCharges = []
+    Discount_ = Decimal(0)
+    DutiesAndTaxes_ = Decimal(0)
+    for charge in qtdshp.QtdShpExChrg:
+        name = charge.LocalServiceTypeName
+        value = charge.ChargeValue or 0
+        ExtraCharges.append(
+            ChargeDetails(
+                name=name, amount=decimal(value), currency=qtdshp.CurrencyCode
+            )
         )
-    )
-    Discount_ = reduce(
-        lambda d, ec: d + ec.amount if "Discount" in ec.name else d, ExtraCharges, 0.0
-    )
-    DutiesAndTaxes_ = reduce(
-        lambda d, ec: d + ec.amount if "TAXES PAID" in ec.name else d, ExtraCharges, 0.0
-    )
+        if "Discount" in name:
+            Discount_ += Decimal(str(value))
+        elif "TAXES PAID" in name:
+            DutiesAndTaxes_ += Decimal(str(value))
     delivery_date = to_date(qtdshp.DeliveryDate[0].DlvyDateTime, "%Y-%m-%d %H:%M:%S")
     pricing_date = to_date(qtdshp.PricingDate)
     transit = (
         (delivery_date - pricing_date).days if all([delivery_date, pricing_date]) else None
     )
     service_name = next(
-        (p.name for p in Product if p.value in qtdshp.LocalProductName),
+        (name for value, name in _PRODUCTS if value in qtdshp.LocalProductName),
         qtdshp.LocalProductName,
     )
     return RateDetails(
@@ -82,16 +93,7 @@ def _extract_quote(qtdshp_node: Element, settings: Settings) -> RateDetails:
         total_charge=decimal(qtdshp.ShippingCharge),
         duties_and_taxes=decimal(DutiesAndTaxes_),
         discount=decimal(Discount_),
-        extra_charges=list(
-            map(
-                lambda s: ChargeDetails(
-                    name=s.LocalServiceTypeName,
-                    amount=decimal(s.ChargeValue),
-                    currency=qtdshp.CurrencyCode
-                ),
-                qtdshp.QtdShpExChrg,
-            )
-        ),
+        extra_charges=ExtraCharges,
     )
 
 
@@ -99,17 +101,19 @@ def dct_request(payload: RateRequest, settings: Settings) -> Serializable[DCTReq
     packages = Packages(payload.parcels, PackagePresets, required=["weight"])
     options = Options(payload.options)
     is_international = payload.shipper.country_code != payload.recipient.country_code
-    is_document = all([parcel.is_document for parcel in payload.parcels])
+    is_document = all(parcel.is_document for parcel in payload.parcels)
     is_dutiable = not is_document
     products = [
-        ProductCode[svc].value
-        for svc in payload.services
-        if svc in ProductCode.__members__
+        product.value
+        for product in (ProductCode.__members__.get(svc) for svc in payload.services)
+        if product is not None
     ]
     special_services = [
-        SpecialServiceCode[s].value
-        for s in payload.options.keys()
-        if s in SpecialServiceCode.__members__
+        service.value
+        for service in (
+            SpecialServiceCode.__members__.get(key) for key in payload.options.keys()
+        )
+        if service is not None
     ]
     if is_international and is_dutiable:
         special_services.append(SpecialServiceCode.dhl_paperless_trade.value)
@@ -123,6 +127,7 @@ def dct_request(payload: RateRequest, settings: Settings) -> Serializable[DCTReq
                 (ProductCode.dhl_express_easy_doc if is_document else ProductCode.dhl_express_easy_nondoc).value
             ]
 
+    now = time.localtime()
     request = DCTRequest(
         GetQuote=GetQuoteType(
             Request=settings.Request(
@@ -145,8 +150,8 @@ def dct_request(payload: RateRequest, settings: Settings) -> Serializable[DCTReq
                 NetworkTypeCode=NetworkType.both_time_and_day_definite.value,
                 WeightUnit=WeightUnit.LB.value,
                 DimensionUnit=DimensionUnit.IN.value,
-                ReadyTime=time.strftime("PT%HH%MM"),
-                Date=time.strftime("%Y-%m-%d"),
+                ReadyTime=time.strftime("PT%HH%MM", now),
+                Date=time.strftime("%Y-%m-%d", now),
                 IsDutiable=("Y" if is_dutiable else "N"),
                 Pieces=PiecesType(
                     Piece=[
@@ -193,11 +198,8 @@ def dct_request(payload: RateRequest, settings: Settings) -> Serializable[DCTReq
 
 
 def _request_serializer(request: DCTRequest) -> str:
-    namespacedef_ = (
-        'xmlns:p="http://www.dhl.com" xmlns:p1="http://www.dhl.com/datatypes" xmlns:p2="http://www.dhl.com/DCTRequestdatatypes" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.dhl.com DCT-req.xsd "'
-    )
     return export(
         request,
         name_="p:DCTRequest",
-        namespacedef_=namespacedef_,
+        namespacedef_=_NAMESPACE_DEF,
     ).replace('schemaVersion="2."', 'schemaVersion="2.0"')
@@ -1,13 +1,16 @@
 from typing import List, Callable
 from functools import reduce
+from lxml.etree import XPath
 from purplship.core.utils.xml import Element
 from purplship.providers.dhl import Settings
 from purplship.core.models import Message
 from pydhl.dct_response_global_2_0 import ConditionType
 
+_NODES_XPATH = XPath(".//*[local-name() = $name]", smart_strings=False)
+
 
 def parse_error_response(response, settings: Settings) -> List[Message]:
-    conditions = response.xpath(".//*[local-name() = $name]", name="Condition")
+    conditions = _NODES_XPATH(response, name="Condition")
     return reduce(_extract_error(settings), conditions, [])
 
 
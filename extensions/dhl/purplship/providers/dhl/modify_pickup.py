@@ -1,4 +1,6 @@
+import re
 from typing import Tuple, List
+from lxml.etree import XPath
 from pydhl.modify_pickup_global_req_3_0 import ModifyPURequest, MetaData
 from pydhl.modify_pickup_global_res_3_0 import ModifyPUResponse
 from pydhl.pickupdatatypes_global_3_0 import (
@@ -24,15 +26,22 @@ from purplship.core.models import (
 )
 from purplship.core.units import WeightUnit, Weight
 from purplship.providers.dhl.units import CountryRegion, WeightUnit as DHLWeightUnit
-from purplship.providers.dhl.utils import Settings, reformat_time
+from purplship.providers.dhl.utils import Settings
 from purplship.providers.dhl.error import parse_error_response
 
+_NODES_XPATH = XPath(".//*[local-name() = $name]", smart_strings=False)
+# trims ReadyByTime/CloseTime values to HH:MM once the prefix is stripped
+_TIME_PATTERN = re.compile(r"(<(?:ReadyByTime|CloseTime)>\d+:\d+):\d+")
+_NAMESPACE_DEF = (
+    'xmlns:req="http://www.dhl.com" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.dhl.com modify-pickup-Global-req.xsd"'
+)
+
 
 def parse_modify_pickup_response(
     response, settings: Settings
 ) -> Tuple[PickupDetails, List[Message]]:
     successful = (
-        len(response.xpath(".//*[local-name() = $name]", name="ConfirmationNumber")) > 0
+        len(_NODES_XPATH(response, name="ConfirmationNumber")) > 0
     )
     pickup = _extract_pickup(response, settings) if successful else None
     return pickup, parse_error_response(response, settings)
@@ -67,12 +76,8 @@ def modify_pickup_request(
     payload: PickupUpdateRequest, settings: Settings
 ) -> Serializable[ModifyPURequest]:
     weight_unit = DHLWeightUnit.LB
-    weight = sum(
-        [
-            Weight(parcel.weight, WeightUnit[weight_unit.name]).LB
-            for parcel in payload.parcels
-        ]
-    )
+    unit = WeightUnit[weight_unit.name]
+    weight = sum(Weight(parcel.weight, unit).LB for parcel in payload.parcels)
     request = ModifyPURequest(
         Request=settings.Request(
             MetaData=MetaData(SoftwareName="XMLPI", SoftwareVersion=1.0)
@@ -124,8 +129,6 @@ def _request_serializer(request: ModifyPURequest) -> str:
     xml_str = export(
         request,
         name_="req:ModifyPURequest",
-        namespacedef_='xmlns:req="http://www.dhl.com" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.dhl.com modify-pickup-Global-req.xsd"',
+        namespacedef_=_NAMESPACE_DEF,
     ).replace("dhlPickup:", "")
-
-    xml_str = reformat_time("CloseTime", reformat_time("ReadyByTime", xml_str))
-    return xml_str
+    return _TIME_PATTERN.sub(r"\1", xml_str)
@@ -1,7 +1,13 @@
+import re
 import time
 from pydhl.datatypes_global_v62 import ServiceHeader, Request
 from purplship.core import Settings as BaseSettings
 
+_TIME_PATTERNS = {
+    tag: re.compile(fr"(<{tag}>\d+:\d+):\d+")
+    for tag in ("ReadyByTime", "CloseTime", "CancelTime")
+}
+
 
 class Settings(BaseSettings):
     """DHL connection settings."""
@@ -35,6 +41,7 @@ def reformat_time(tag: str, xml_str: str) -> str:
     """
     Change time format from 00:00:00 to 00:00
     """
-    parts = xml_str.split(tag)
-    subs = parts[1].split(":")
-    return f"{parts[0]}{tag}{subs[0]}:{subs[1]}</{tag}{parts[2]}"
+    pattern = _TIME_PATTERNS.get(tag) or _TIME_PATTERNS.setdefault(
+        tag, re.compile(fr"(<{tag}>\d+:\d+):\d+")
+    )
+    return pattern.sub(r"\1", xml_str)
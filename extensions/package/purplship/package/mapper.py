@@ -1,8 +1,7 @@
 """PurplShip Mapper base class definition module."""
 
-import attr
 from abc import ABC
-from typing import List, Tuple
+from typing import List, NoReturn, Tuple
 from purplship.core.settings import Settings
 from purplship.core.models import (
     Message,
@@ -21,101 +20,78 @@ from purplship.core.errors import MethodNotSupportedError
 from purplship.core.utils.serializable import Deserializable, Serializable
 
 
-@attr.s(auto_attribs=True)
 class Mapper(ABC):
     """Unified Shipping API Mapper (Interface)
     """
 
-    settings: Settings
+    __slots__ = ("settings",)
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+    def _unsupported(self, operation: str) -> NoReturn:
+        raise MethodNotSupportedError(operation, self.__class__.__name__)
 
     def create_rate_request(self, payload: RateRequest) -> Serializable:
         """ Create a carrier specific rate request data from payload """
-        raise MethodNotSupportedError(
-            self.__class__.create_rate_request.__name__, self.__class__.__name__
-        )
+        self._unsupported("create_rate_request")
 
     def parse_rate_response(
         self, response: Deserializable
     ) -> Tuple[List[RateDetails], List[Message]]:
         """ Create a united API quote result list from carrier response  """
-        raise MethodNotSupportedError(
-            self.__class__.parse_rate_response.__name__, self.__class__.__name__
-        )
+        self._unsupported("parse_rate_response")
 
     def create_tracking_request(self, payload: TrackingRequest) -> Serializable:
         """ Create a carrier specific tracking request data from payload """
-        raise MethodNotSupportedError(
-            self.__class__.create_tracking_request.__name__, self.__class__.__name__
-        )
+        self._unsupported("create_tracking_request")
 
     def parse_tracking_response(
         self, response: Deserializable
     ) -> Tuple[List[TrackingDetails], List[Message]]:
         """ Create a united API tracking result list from carrier response  """
-        raise MethodNotSupportedError(
-            self.__class__.parse_tracking_response.__name__, self.__class__.__name__
-        )
+        self._unsupported("parse_tracking_response")
 
     def create_shipment_request(self, payload: ShipmentRequest) -> Serializable:
         """ Create a carrier specific shipment creation request data from payload """
-        raise MethodNotSupportedError(
-            self.__class__.create_shipment_request.__name__, self.__class__.__name__
-        )
+        self._unsupported("create_shipment_request")
 
     def parse_shipment_response(
         self, response: Deserializable
     ) -> Tuple[ShipmentDetails, List[Message]]:
         """ Create a united API shipment creation result from carrier response  """
-        raise MethodNotSupportedError(
-            self.__class__.parse_shipment_response.__name__, self.__class__.__name__
-        )
+        self._unsupported("parse_shipment_response")
 
     def create_pickup_request(self, payload: PickupRequest) -> Serializable:
         """ Create a carrier specific pickup request xml data from payload """
-        raise MethodNotSupportedError(
-            self.__class__.create_pickup_request.__name__, self.__class__.__name__
-        )
+        self._unsupported("create_pickup_request")
 
     def parse_pickup_response(
         self, response: Deserializable
     ) -> Tuple[PickupDetails, List[Message]]:
         """ Create a united API pickup result from carrier response  """
-        raise MethodNotSupportedError(
-            self.__class__.parse_pickup_response.__name__, self.__class__.__name__
-        )
+        self._unsupported("parse_pickup_response")
 
     def create_modify_pickup_request(
         self, payload: PickupUpdateRequest
     ) -> Serializable:
         """ Create a carrier specific pickup modification request data from payload """
-        raise MethodNotSupportedError(
-            self.__class__.create_modify_pickup_request.__name__,
-            self.__class__.__name__,
-        )
+        self._unsupported("create_modify_pickup_request")
 
     def parse_modify_pickup_response(
         self, response: Deserializable
     ) -> Tuple[PickupDetails, List[Message]]:
         """ Create a united API pickup result from carrier response  """
-        raise MethodNotSupportedError(
-            self.__class__.parse_modify_pickup_response.__name__,
-            self.__class__.__name__,
-        )
+        self._unsupported("parse_modify_pickup_response")
 
     def create_cancel_pickup_request(
         self, payload: PickupCancellationRequest
     ) -> Serializable:
         """ Create a carrier specific pickup cancellation request data from payload """
-        raise MethodNotSupportedError(
-            self.__class__.create_cancel_pickup_request.__name__,
-            self.__class__.__name__,
-        )
+        self._unsupported("create_cancel_pickup_request")
 
     def parse_cancel_pickup_response(
         self, response: Deserializable
     ) -> Tuple[dict, List[Message]]:
         """ Create a united API pickup cancellation result from carrier response  """
-        raise MethodNotSupportedError(
-            self.__class__.parse_cancel_pickup_response.__name__,
-            self.__class__.__name__,
-        )
+        self._unsupported("parse_cancel_pickup_response")
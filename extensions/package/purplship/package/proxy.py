@@ -1,50 +1,41 @@
 """PurplShip Proxy base class definition module."""
 
-import attr
 from abc import ABC
+from typing import NoReturn
 from purplship.core.settings import Settings
 from purplship.core.errors import MethodNotSupportedError
 from purplship.core.utils.serializable import Deserializable, Serializable
 
 
-@attr.s(auto_attribs=True)
 class Proxy(ABC):
     """Unified Shipping API Proxy (Interface)
     """
 
-    settings: Settings
+    __slots__ = ("settings",)
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+    def _unsupported(self, operation: str) -> NoReturn:
+        raise MethodNotSupportedError(operation, self.__class__.__name__)
 
     def get_rates(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.get_rates.__name__, self.__class__.__name__
-        )
+        self._unsupported("get_rates")
 
     def get_tracking(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.get_tracking.__name__, self.__class__.__name__
-        )
+        self._unsupported("get_tracking")
 
     def create_shipment(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.create_shipment.__name__, self.__class__.__name__
-        )
+        self._unsupported("create_shipment")
 
     def request_pickup(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.request_pickup.__name__, self.__class__.__name__
-        )
+        self._unsupported("request_pickup")
 
     def update_pickup(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.update_pickup.__name__, self.__class__.__name__
-        )
+        self._unsupported("update_pickup")
 
     def modify_pickup(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.modify_pickup.__name__, self.__class__.__name__
-        )
+        self._unsupported("modify_pickup")
 
     def cancel_pickup(self, request: Serializable) -> Deserializable:
-        raise MethodNotSupportedError(
-            self.__class__.cancel_pickup.__name__, self.__class__.__name__
-        )
+        self._unsupported("cancel_pickup")
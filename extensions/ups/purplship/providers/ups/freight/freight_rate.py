@@ -1,5 +1,5 @@
-from functools import reduce
 from typing import List, Tuple
+from lxml.etree import XPath
 from pyups import common
 from pyups.freight_rate_web_service_schema import (
     FreightRateRequest,
@@ -30,13 +30,25 @@ from purplship.providers.ups.units import (
 from purplship.providers.ups.error import parse_error_response
 from purplship.providers.ups.utils import Settings
 
+_NODES_XPATH = XPath(".//*[local-name() = $name]", smart_strings=False)
+_NAMESPACE_DEF = """
+    xmlns:tns="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:upss="http://www.ups.com/XMLSchema/XOLTWS/UPSS/v1.0"
+    xmlns:wsf="http://www.ups.com/schema/wsf"
+    xmlns:common="http://www.ups.com/XMLSchema/XOLTWS/Common/v1.0"
+    xmlns:frt="http://www.ups.com/XMLSchema/XOLTWS/FreightRate/v1.0"
+""".replace(
+    " ", ""
+).replace(
+    "\n", " "
+)
+
 
 def parse_freight_rate_response(
     response: Element, settings: Settings
 ) -> Tuple[List[RateDetails], List[Message]]:
-    rate_reply = response.xpath(
-        ".//*[local-name() = $name]", name="FreightRateResponse"
-    )
+    rate_reply = _NODES_XPATH(response, name="FreightRateResponse")
     rates: List[RateDetails] = [
         _extract_freight_rate(detail_node, settings) for detail_node in rate_reply
     ]
@@ -69,7 +81,7 @@ def _extract_freight_rate(detail_node: Element, settings: Settings) -> RateDetai
     extra_charges = Discounts_ + Surcharges_
     currency_ = next(
         c.text
-        for c in detail_node.xpath(".//*[local-name() = $name]", name="CurrencyCode")
+        for c in _NODES_XPATH(detail_node, name="CurrencyCode")
     )
     return RateDetails(
         carrier_name=settings.carrier_name,
@@ -78,8 +90,8 @@ def _extract_freight_rate(detail_node: Element, settings: Settings) -> RateDetai
         service=detail.Service.Description,
         base_charge=decimal(detail.TotalShipmentCharge.MonetaryValue),
         total_charge=decimal(total_charge.Factor.Value or 0.0),
-        duties_and_taxes=decimal(reduce(lambda r, c: r + c.amount, Surcharges_, 0.0)),
-        discount=decimal(reduce(lambda r, c: r + c.amount, Discounts_, 0.0)),
+        duties_and_taxes=decimal(sum(c.amount for c in Surcharges_)),
+        discount=decimal(sum(c.amount for c in Discounts_)),
         extra_charges=extra_charges,
     )
 
@@ -90,9 +102,9 @@ def freight_rate_request(
     packages = Packages(payload.parcels, PackagePresets)
     service = (
         [
-            RatingServiceCode[svc]
-            for svc in payload.services
-            if svc in RatingServiceCode.__members__
+            svc
+            for svc in (RatingServiceCode.__members__.get(s) for s in payload.services)
+            if svc is not None
         ]
         + [RatingServiceCode.ups_freight_ltl_guaranteed]
     )[0]
@@ -177,20 +189,8 @@ def freight_rate_request(
 
 
 def _request_serializer(request: Element) -> str:
-    namespace_ = """
-        xmlns:tns="http://schemas.xmlsoap.org/soap/envelope/"
-        xmlns:xsd="http://www.w3.org/2001/XMLSchema"
-        xmlns:upss="http://www.ups.com/XMLSchema/XOLTWS/UPSS/v1.0"
-        xmlns:wsf="http://www.ups.com/schema/wsf"
-        xmlns:common="http://www.ups.com/XMLSchema/XOLTWS/Common/v1.0"
-        xmlns:frt="http://www.ups.com/XMLSchema/XOLTWS/FreightRate/v1.0"
-    """.replace(
-        " ", ""
-    ).replace(
-        "\n", " "
-    )
     return clean_namespaces(
-        export(request, namespacedef_=namespace_),
+        export(request, namespacedef_=_NAMESPACE_DEF),
         envelope_prefix="tns:",
         header_child_prefix="upss:",
         header_child_name="UPSSecurity",
@@ -1,19 +1,24 @@
 from typing import List
+from lxml.etree import XPath
 from pyusps.error import Error
 from purplship.core.utils.xml import Element
 from purplship.core.models import Message
 from purplship.providers.usps.utils import Settings
 
+_NODES_XPATH = XPath(".//*[local-name() = $name]", smart_strings=False)
+
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    error_nodes: List[Error] = [
-        (lambda error: (error, error.build(node)))(Error())[0]
-        for node in (
-            [response]
-            if response.tag == "Error"
-            else response.xpath(".//*[local-name() = $name]", name="Error")
-        )
-    ]
+    nodes = (
+        [response]
+        if response.tag == "Error"
+        else _NODES_XPATH(response, name="Error")
+    )
+    error_nodes: List[Error] = []
+    for node in nodes:
+        error = Error()
+        error.build(node)
+        error_nodes.append(error)
     return [
         Message(
             carrier_name=settings.carrier_name,
@@ -1,10 +1,20 @@
 from dataclasses import dataclass
-from typing import List, Type, Optional, Iterator, Iterable
+from functools import lru_cache
+from typing import List, Type, Optional, Iterator, Iterable, TYPE_CHECKING
 from enum import Enum
 from purplship.core.utils import decimal
-from purplship.core.models import Insurance, COD, Notification, Parcel
 from purplship.core.errors import FieldError, FieldErrorCode, MultiParcelNotSupportedError
 
+if TYPE_CHECKING:
+    from purplship.core.models import Parcel
+
+_CM_TO_IN = 2.54
+_IN_TO_CM = 0.393701
+_KG_TO_LB = 2.204620823516057
+_LB_TO_KG = 0.453592
+_KG_TO_OZ = 35.274
+_LB_TO_OZ = 16
+
 
 @dataclass
 class PackagePreset:
@@ -59,41 +69,42 @@ class DimensionUnit(Enum):
 
 
 class Dimension:
+    __slots__ = ("_value", "_unit", "_cm", "_in", "_m")
+
     def __init__(self, value: float, unit: DimensionUnit = DimensionUnit.CM):
         self._value = value
         self._unit = unit
+        if unit is None or value is None:
+            self._cm = self._in = self._m = None
+        elif unit == DimensionUnit.CM:
+            self._cm = decimal(value)
+            self._in = decimal(value * _CM_TO_IN)
+            self._m = decimal(self._cm / 100)
+        else:
+            self._cm = decimal(value * _IN_TO_CM)
+            self._in = decimal(value)
+            self._m = decimal(self._cm / 100)
 
     @property
     def value(self):
-        return self.__getattribute__(str(self._unit.name))
+        return getattr(self, self._unit.name)
 
     @property
     def CM(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == DimensionUnit.CM:
-            return decimal(self._value)
-        else:
-            return decimal(self._value * 0.393701)
+        return self._cm
 
     @property
     def IN(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == DimensionUnit.IN:
-            return decimal(self._value)
-        else:
-            return decimal(self._value * 2.54)
+        return self._in
 
     @property
     def M(self):
-        if self._unit is None or self._value is None:
-            return None
-        else:
-            return decimal(self.CM / 100)
+        return self._m
 
 
 class Volume:
+    __slots__ = ("_side1", "_side2", "_side3")
+
     def __init__(
         self, side1: Dimension = None, side2: Dimension = None, side3: Dimension = None
     ):
@@ -103,10 +114,11 @@ class Volume:
 
     @property
     def value(self):
-        if not any([self._side1.value, self._side2.value, self._side3.value]):
+        side1, side2, side3 = self._side1.M, self._side2.M, self._side3.M
+        if not any((side1, side2, side3)):
             return None
 
-        return decimal(self._side1.M * self._side2.M * self._side3.M)
+        return decimal(side1 * side2 * side3)
 
     @property
     def cubic_meter(self):
@@ -116,6 +128,8 @@ class Volume:
 
 
 class Girth:
+    __slots__ = ("_side1", "_side2", "_side3")
+
     def __init__(
         self, side1: Dimension = None, side2: Dimension = None, side3: Dimension = None
     ):
@@ -125,83 +139,104 @@ class Girth:
 
     @property
     def value(self):
-        sides = [self._side1.CM, self._side2.CM, self._side3.CM]
-        if not any(sides):
+        side1, side2, side3 = self._side1.CM, self._side2.CM, self._side3.CM
+        if not (side1 or side2 or side3):
             return None
 
-        sides.sort()
-        small_side1, small_side2, _ = sides
-        return decimal((small_side1 + small_side2) * 2)
+        largest = side1 if side1 > side2 else side2
+        largest = largest if largest > side3 else side3
+        return decimal((side1 + side2 + side3 - largest) * 2)
 
 
 class Weight:
+    __slots__ = ("_value", "_unit", "_kg", "_lb", "_oz")
+
     def __init__(self, value: float, unit: WeightUnit = WeightUnit.KG):
         self._value = value
         self._unit = unit
+        if unit is None or value is None:
+            self._kg = self._lb = self._oz = None
+        elif unit == WeightUnit.KG:
+            self._kg = decimal(value)
+            self._lb = decimal(value * _KG_TO_LB)
+            self._oz = decimal(value * _KG_TO_OZ)
+        elif unit == WeightUnit.LB:
+            self._kg = decimal(value * _LB_TO_KG)
+            self._lb = decimal(value)
+            self._oz = decimal(value * _LB_TO_OZ)
+        else:
+            self._kg = self._lb = self._oz = None
 
     @property
     def value(self):
-        return self.__getattribute__(str(self._unit.name))
+        return getattr(self, self._unit.name)
 
     @property
     def KG(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == WeightUnit.KG:
-            return decimal(self._value)
-        elif self._unit == WeightUnit.LB:
-            return decimal(self._value * 0.453592)
-
-        return None
+        return self._kg
 
     @property
     def LB(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == WeightUnit.LB:
-            return decimal(self._value)
-        elif self._unit == WeightUnit.KG:
-            return decimal(self._value * 2.204620823516057)
-
-        return None
+        return self._lb
 
     @property
     def OZ(self):
-        if self._unit is None or self._value is None:
-            return None
-        if self._unit == WeightUnit.LB:
-            return decimal(self._value * 16)
-        elif self._unit == WeightUnit.KG:
-            return decimal(self._value * 35.274)
-
-        return None
+        return self._oz
 
 
 class Package:
-    def __init__(self, parcel: Parcel, template: PackagePreset = None):
+    __slots__ = (
+        "parcel",
+        "preset",
+        "_dimension_unit",
+        "_weight_unit",
+        "_weight",
+        "_width",
+        "_height",
+        "_length",
+        "_girth",
+        "_volume",
+    )
+
+    def __init__(self, parcel: "Parcel", template: PackagePreset = None):
         self.parcel = parcel
         self.preset = template or PackagePreset()
 
-    @property
-    def dimension_unit(self):
-        dimensions = [self.parcel.height, self.parcel.width, self.parcel.length]
-        unit = (
-            (self.parcel.dimension_unit or self.preset.dimension_unit)
+        dimensions = [parcel.height, parcel.width, parcel.length]
+        self._dimension_unit = DimensionUnit[
+            (parcel.dimension_unit or self.preset.dimension_unit)
             if any(dimensions)
             else self.preset.dimension_unit
+        ]
+        self._weight_unit = WeightUnit[
+            self.preset.weight_unit
+            if parcel.weight is None
+            else (parcel.weight_unit or self.preset.weight_unit)
+        ]
+
+        dimension_unit = self._dimension_unit
+        self._weight = Weight(
+            self.parcel.weight or self.preset.weight, self._weight_unit
+        )
+        self._width = Dimension(
+            self.preset.width or self.parcel.width, dimension_unit
+        )
+        self._height = Dimension(
+            self.preset.height or self.parcel.height, dimension_unit
+        )
+        self._length = Dimension(
+            self.preset.length or self.parcel.length, dimension_unit
         )
+        self._girth = Girth(self._width, self._length, self._height)
+        self._volume = Volume(self._width, self._length, self._height)
 
-        return DimensionUnit[unit]
+    @property
+    def dimension_unit(self):
+        return self._dimension_unit
 
     @property
     def weight_unit(self):
-        unit = (
-            self.preset.weight_unit
-            if self.parcel.weight is None
-            else (self.parcel.weight_unit or self.preset.weight_unit)
-        )
-
-        return WeightUnit[unit]
+        return self._weight_unit
 
     @property
     def packaging_type(self):
@@ -209,31 +244,27 @@ class Package:
 
     @property
     def weight(self):
-        return Weight(self.parcel.weight or self.preset.weight, self.weight_unit)
+        return self._weight
 
     @property
     def width(self):
-        return Dimension(self.preset.width or self.parcel.width, self.dimension_unit)
+        return self._width
 
     @property
     def height(self):
-        return Dimension(
-            self.preset.height or self.parcel.height, self.dimension_unit
-        )
+        return self._height
 
     @property
     def length(self):
-        return Dimension(
-            self.preset.length or self.parcel.length, self.dimension_unit
-        )
+        return self._length
 
     @property
     def girth(self):
-        return Girth(self.width, self.length, self.height)
+        return self._girth
 
     @property
     def volume(self):
-        return Volume(self.width, self.length, self.height)
+        return self._volume
 
     @property
     def thickness(self):
@@ -241,14 +272,18 @@ class Package:
 
 
 class Packages(Iterable[Package]):
-    def __init__(self, parcels: List[Parcel], presets: Type[Enum] = None, required: List[str] = None):
+    def __init__(self, parcels: List["Parcel"], presets: Type[Enum] = None, required: List[str] = None):
+        member_map = presets.__members__ if presets is not None else {}
+
         def compute_preset(parcel) -> Optional[PackagePreset]:
-            if (presets is None) | (presets is not None and parcel.package_preset not in presets.__members__):
+            if presets is None or parcel.package_preset not in member_map:
                 return None
 
-            return presets[parcel.package_preset].value
+            return member_map[parcel.package_preset].value
 
         self._items = [Package(parcel, compute_preset(parcel)) for parcel in parcels]
+        self._wt_lb = [pkg.weight.LB for pkg in self._items if pkg.weight.LB is not None]
+        self._weight: Optional[Weight] = None
 
         if required is not None:
             errors = {}
@@ -257,9 +292,9 @@ class Packages(Iterable[Package]):
                     prop = getattr(package, field)
 
                     if prop is None or (hasattr(prop, 'value') and prop.value is None):
-                        errors.update({f"parcel[{index}].{field}": FieldErrorCode.required})
+                        errors[f"parcel[{index}].{field}"] = FieldErrorCode.required
 
-            if any(errors.items()):
+            if errors:
                 raise FieldError(errors)
 
     def __getitem__(self, index: int) -> Package:
@@ -279,45 +314,52 @@ class Packages(Iterable[Package]):
 
     @property
     def weight(self) -> Weight:
-        return Weight(
-            unit=WeightUnit.LB,
-            value=sum(pkg.weight.LB for pkg in self._items if pkg.weight.value is not None) or None
-        )
+        if self._weight is None:
+            self._weight = Weight(unit=WeightUnit.LB, value=sum(self._wt_lb) or None)
+        return self._weight
 
 
 class Options:
+    __slots__ = ("_payload",)
+
     def __init__(self, payload: dict):
         self._payload = payload
 
     @property
     def has_content(self):
-        return any(o for o in self._payload if o in Options.Code.__members__)
+        return not Options._CODE_NAMES.isdisjoint(self._payload)
 
     @property
     def cash_on_delivery(self):
-        if Options.Code.cash_on_delivery.name in self._payload:
-            return COD(**self._payload[Options.Code.cash_on_delivery.name])
+        if Options._COD_KEY in self._payload:
+            from purplship.core.models import COD
+
+            return COD(**self._payload[Options._COD_KEY])
         return None
 
     @property
     def currency(self):
-        return self._payload.get(Options.Code.currency.name)
+        return self._payload.get(Options._CURRENCY_KEY)
 
     @property
     def insurance(self):
-        if Options.Code.insurance.name in self._payload:
-            return Insurance(**self._payload[Options.Code.insurance.name])
+        if Options._INSURANCE_KEY in self._payload:
+            from purplship.core.models import Insurance
+
+            return Insurance(**self._payload[Options._INSURANCE_KEY])
         return None
 
     @property
     def notification(self):
-        if Options.Code.notification.name in self._payload:
-            return Notification(**self._payload[Options.Code.notification.name])
+        if Options._NOTIFICATION_KEY in self._payload:
+            from purplship.core.models import Notification
+
+            return Notification(**self._payload[Options._NOTIFICATION_KEY])
         return None
 
     @property
     def printing(self):
-        return self._payload.get(Options.Code.printing.name)
+        return self._payload.get(Options._PRINTING_KEY)
 
     class Code(Enum):  # TODO:: Need to be documented
         cash_on_delivery = "COD"
@@ -326,29 +368,36 @@ class Options:
         notification = "notification"
         printing = "printing"
 
+    _CODE_NAMES = frozenset(Code.__members__)
+    _COD_KEY = Code.cash_on_delivery.name
+    _CURRENCY_KEY = Code.currency.name
+    _INSURANCE_KEY = Code.insurance.name
+    _NOTIFICATION_KEY = Code.notification.name
+    _PRINTING_KEY = Code.printing.name
+
 
 class Phone:
+    __slots__ = ("number", "parts", "_country_code", "_area_code", "_phone")
+
     def __init__(self, phone_number: str = None):
         self.number = phone_number
-        self.parts = phone_number.split(" ") if phone_number is not None else []
+        parts = phone_number.split(" ") if phone_number is not None else []
+        self.parts = parts
+        self._country_code = parts[0] if len(parts) > 0 else None
+        self._area_code = parts[1] if len(parts) > 1 else None
+        self._phone = parts[2] if len(parts) > 2 else None
 
     @property
     def country_code(self):
-        return next((part for part in self.parts), None)
+        return self._country_code
 
     @property
     def area_code(self):
-        return next(
-            (part[1] for part in [self.parts] if len(part) > 1),
-            None
-        )
+        return self._area_code
 
     @property
     def phone(self):
-        return next(
-            (part[2] for part in [self.parts] if len(part) > 2),
-            None
-        )
+        return self._phone
 
 
 class PrinterType(Enum):
@@ -741,420 +790,442 @@ class Country(Enum):
     ZW = "ZIMBABWE"
 
 
-class CountryCurrency(Enum):
-    AD = "EUR"
-    AE = "AED"
-    AF = "USD"
-    AG = "XCD"
-    AI = "XCD"
-    AL = "EUR"
-    AM = "AMD"
-    AN = "ANG"
-    AO = "AOA"
-    AR = "ARS"
-    AS = "USD"
-    AT = "EUR"
-    AU = "AUD"
-    AW = "AWG"
-    AZ = "AZN"
-    BA = "BAM"
-    BB = "BBD"
-    BD = "BDT"
-    BE = "EUR"
-    BF = "XOF"
-    BG = "BGN"
-    BH = "BHD"
-    BI = "BIF"
-    BJ = "XOF"
-    BM = "BMD"
-    BN = "BND"
-    BO = "BOB"
-    BR = "BRL"
-    BS = "BSD"
-    BT = "BTN"
-    BW = "BWP"
-    BY = "BYN"
-    BZ = "BZD"
-    CA = "CAD"
-    CD = "CDF"
-    CF = "XAF"
-    CG = "XAF"
-    CH = "CHF"
-    CI = "XOF"
-    CK = "NZD"
-    CL = "CLP"
-    CM = "XAF"
-    CN = "CNY"
-    CO = "COP"
-    CR = "CRC"
-    CU = "CUC"
-    CV = "CVE"
-    CY = "EUR"
-    CZ = "CZK"
-    DE = "EUR"
-    DJ = "DJF"
-    DK = "DKK"
-    DM = "XCD"
-    DO = "DOP"
-    DZ = "DZD"
-    EC = "USD"
-    EE = "EUR"
-    EG = "EGP"
-    ER = "ERN"
-    ES = "EUR"
-    ET = "ETB"
-    FI = "EUR"
-    FJ = "FJD"
-    FK = "GBP"
-    FM = "USD"
-    FO = "DKK"
-    FR = "EUR"
-    GA = "XAF"
-    GB = "GBP"
-    GD = "XCD"
-    GE = "GEL"
-    GF = "EUR"
-    GG = "GBP"
-    GH = "GHS"
-    GI = "GBP"
-    GL = "DKK"
-    GM = "GMD"
-    GN = "GNF"
-    GP = "EUR"
-    GQ = "XAF"
-    GR = "EUR"
-    GT = "GTQ"
-    GU = "USD"
-    GW = "XOF"
-    GY = "GYD"
-    HK = "HKD"
-    HN = "HNL"
-    HR = "HRK"
-    HT = "HTG"
-    HU = "HUF"
-    IC = "EUR"
-    ID = "IDR"
-    IE = "EUR"
-    IL = "ILS"
-    IN = "INR"
-    IQ = "USD"
-    IR = "IRR"
-    IS = "ISK"
-    IT = "EUR"
-    JE = "GBP"
-    JM = "JMD"
-    JO = "JOD"
-    JP = "JPY"
-    KE = "KES"
-    KG = "KGS"
-    KH = "KHR"
-    KI = "AUD"
-    KM = "KMF"
-    KN = "XCD"
-    KP = "KPW"
-    KR = "KRW"
-    KV = "EUR"
-    KW = "KWD"
-    KY = "KYD"
-    KZ = "KZT"
-    LA = "LAK"
-    LB = "USD"
-    LC = "XCD"
-    LI = "CHF"
-    LK = "LKR"
-    LR = "LRD"
-    LS = "LSL"
-    LT = "EUR"
-    LU = "EUR"
-    LV = "EUR"
-    LY = "LYD"
-    MA = "MAD"
-    MC = "EUR"
-    MD = "MDL"
-    ME = "EUR"
-    MG = "MGA"
-    MH = "USD"
-    MK = "MKD"
-    ML = "XOF"
-    MM = "MMK"
-    MN = "MNT"
-    MO = "MOP"
-    MP = "USD"
-    MQ = "EUR"
-    MR = "MRO"
-    MS = "XCD"
-    MT = "EUR"
-    MU = "MUR"
-    MV = "MVR"
-    MW = "MWK"
-    MX = "MXN"
-    MY = "MYR"
-    MZ = "MZN"
-    NA = "NAD"
-    NC = "XPF"
-    NE = "XOF"
-    NG = "NGN"
-    NI = "NIO"
-    NL = "EUR"
-    NO = "NOK"
-    NP = "NPR"
-    NR = "AUD"
-    NU = "NZD"
-    NZ = "NZD"
-    OM = "OMR"
-    PA = "USD"
-    PE = "PEN"
-    PF = "XPF"
-    PG = "PGK"
-    PH = "PHP"
-    PK = "PKR"
-    PL = "PLN"
-    PR = "USD"
-    PT = "EUR"
-    PW = "USD"
-    PY = "PYG"
-    QA = "QAR"
-    RE = "EUR"
-    RO = "RON"
-    RS = "RSD"
-    RU = "RUB"
-    RW = "RWF"
-    SA = "SAR"
-    SB = "SBD"
-    SC = "SCR"
-    SD = "SDG"
-    SE = "SEK"
-    SG = "SGD"
-    SH = "SHP"
-    SI = "EUR"
-    SK = "EUR"
-    SL = "SLL"
-    SM = "EUR"
-    SN = "XOF"
-    SO = "SOS"
-    SR = "SRD"
-    SS = "SSP"
-    ST = "STD"
-    SV = "USD"
-    SY = "SYP"
-    SZ = "SZL"
-    TC = "USD"
-    TD = "XAF"
-    TG = "XOF"
-    TH = "THB"
-    TJ = "TJS"
-    TL = "USD"
-    TN = "TND"
-    TO = "TOP"
-    TR = "TRY"
-    TT = "TTD"
-    TV = "AUD"
-    TW = "TWD"
-    TZ = "TZS"
-    UA = "UAH"
-    UG = "USD"
-    US = "USD"
-    UY = "UYU"
-    UZ = "UZS"
-    VA = "EUR"
-    VC = "XCD"
-    VE = "VEF"
-    VG = "USD"
-    VI = "USD"
-    VN = "VND"
-    VU = "VUV"
-    WS = "WST"
-    XB = "EUR"
-    XC = "EUR"
-    XE = "ANG"
-    XM = "EUR"
-    XN = "XCD"
-    XS = "USD"
-    XY = "ANG"
-    YE = "YER"
-    YT = "EUR"
-    ZA = "ZAR"
-    ZM = "ZMW"
-    ZW = "USD"
-
-
-class CountryState(Enum):
-    AE = Enum("State", {
-        "AB": "Abu Dhabi",
-        "AJ": "Ajman",
-        "DU": "Dubai",
-        "FU": "Fujairah",
-        "RA": "Ras al-Khaimah",
-        "SH": "Sharjah",
-        "UM": "Umm al-Qaiwain",
-    })
-    CA = Enum("State", {
-        "AB": "Alberta",
-        "BC": "British Columbia",
-        "MB": "Manitoba",
-        "NB": "New Brunswick",
-        "NL": "Newfoundland",
-        "NT": "Northwest Territories",
-        "NS": "Nova Scotia",
-        "NU": "Nunavut",
-        "ON": "Ontario",
-        "PE": "Prince Edward Island",
-        "QC": "Quebec",
-        "SK": "Saskatchewan",
-        "YT": "Yukon",
-    })
-    CN = Enum("State", {
-        "anhui": "Anhui",
-        "hainan": "Hainan",
-        "jiangxi": "Jiangxi",
-        "shanghai": "Shanghai",
-        "beijing": "Beijing",
-        "hebei": "Hebei",
-        "jilin": "Jilin",
-        "shanxi": "Shanxi",
-        "chongqing": "Chongqing",
-        "heilongjiang": "Heilongjiang",
-        "liaoning": "Liaoning",
-        "sichuan": "Sichuan",
-        "fujian": "Fujian",
-        "henan": "Henan",
-        "nei_mongol": "Nei Mongol",
-        "tianjin": "Tianjin",
-        "gansu": "Gansu",
-        "hubei": "Hubei",
-        "qinghai": "Qinghai",
-        "xinjiang": "Xinjiang",
-        "guangdong": "Guangdong",
-        "hunan": "Hunan",
-        "shaanxi": "Shaanxi",
-        "yunnan": "Yunnan",
-        "guizhou": "Guizhou",
-        "jiangsu": "Jiangsu",
-        "shandong": "Shandong",
-        "zhejiang": "Zhejiang",
-    })
-    IN = Enum("State", {
-        "AN": "Andaman & Nicobar (U.T)",
-        "AP": "Andhra Pradesh",
-        "AR": "Arunachal Pradesh",
-        "AS": "Assam",
-        "BR": "Bihar",
-        "CG": "Chattisgarh",
-        "CH": "Chandigarh (U.T.)",
-        "DD": "Daman & Diu (U.T.)",
-        "DL": "Delhi (U.T.)",
-        "DN": "Dadra and Nagar Haveli (U.T.)",
-        "GA": "Goa",
-        "GJ": "Gujarat",
-        "HP": "Himachal Pradesh",
-        "HR": "Haryana",
-        "JH": "Jharkhand",
-        "JK": "Jammu & Kashmir",
-        "KA": "Karnataka",
-        "KL": "Kerala",
-        "LD": "Lakshadweep (U.T)",
-        "MH": "Maharashtra",
-        "ML": "Meghalaya",
-        "MN": "Manipur",
-        "MP": "Madhya Pradesh",
-        "MZ": "Mizoram",
-        "NL": "Nagaland",
-        "OR": "Orissa",
-        "PB": "Punjab",
-        "PY": "Puducherry (U.T.)",
-        "RJ": "Rajasthan",
-        "SK": "Sikkim",
-        "TN": "Tamil Nadu",
-        "TR": "Tripura",
-        "UA": "Uttaranchal",
-        "UP": "Uttar Pradesh",
-        "WB": "West Bengal",
-    })
-    MX = Enum("State", {
-        "AG": "Aguascalientes",
-        "BC": "Baja California",
-        "BS": "Baja California Sur",
-        "CM": "Campeche",
-        "CS": "Chiapas",
-        "CH": "Chihuahua",
-        "CO": "Coahuila",
-        "CL": "Colima",
-        "DF": "Ciudad de México",
-        "DG": "Durango",
-        "GT": "Guanajuato",
-        "GR": "Guerrero",
-        "HG": "Hidalgo",
-        "JA": "Jalisco",
-        "EM": "Estado de México",
-        "MI": "Michoacán",
-        "MO": "Morelos",
-        "NA": "Nayarit",
-        "NL": "Nuevo León",
-        "OA": "Oaxaca",
-        "PU": "Puebla",
-        "QE": "Querétaro",
-        "QR": "Quintana Roo",
-        "SL": "San Luis Potosí",
-        "SI": "Sinaloa",
-        "SO": "Sonora",
-        "TB": "Tabasco",
-        "TM": "Tamaulipas",
-        "TL": "Tlaxcala",
-        "VE": "Veracruz",
-        "YU": "Yucatán",
-        "ZA": "Zacatecas",
-    })
-    US = Enum("State", {
-        "AL": "Alabama",
-        "AK": "Alaska",
-        "AZ": "Arizona",
-        "AR": "Arkansas",
-        "CA": "California",
-        "CO": "Colorado",
-        "CT": "Connecticut",
-        "DE": "Delaware",
-        "DC": "District of Columbia",
-        "FL": "Florida",
-        "GA": "Georgia",
-        "HI": "Hawaii",
-        "ID": "Idaho",
-        "IL": "Illinois",
-        "IN": "Indiana",
-        "IA": "Iowa",
-        "KS": "Kansas",
-        "KY": "Kentucky",
-        "LA": "Louisiana",
-        "ME": "Maine",
-        "MD": "Maryland",
-        "MA": "Massachusetts",
-        "MI": "Michigan",
-        "MN": "Minnesota",
-        "MS": "Mississippi",
-        "MO": "Missouri",
-        "MT": "Montana",
-        "NE": "Nebraska",
-        "NV": "Nevada",
-        "NH": "New Hampshire",
-        "NJ": "New Jersey",
-        "NM": "New Mexico",
-        "NY": "New York",
-        "NC": "North Carolina",
-        "ND": "North Dakota",
-        "OH": "Ohio",
-        "OK": "Oklahoma",
-        "OR": "Oregon",
-        "PA": "Pennsylvania",
-        "RI": "Rhode Island",
-        "SC": "South Carolina",
-        "SD": "South Dakota",
-        "TN": "Tennessee",
-        "TX": "Texas",
-        "UT": "Utah",
-        "VT": "Vermont",
-        "VA": "Virginia",
-        "WA": "Washington State",
-        "WV": "West Virginia",
-        "WI": "Wisconsin",
-        "WY": "Wyoming",
-        "PR": "Puerto Rico",
-    })
+class CountryCurrency:
+    """Country to currency code table, materialized into an Enum on demand."""
+
+    _CURRENCIES = {
+        "AD": "EUR",
+        "AE": "AED",
+        "AF": "USD",
+        "AG": "XCD",
+        "AI": "XCD",
+        "AL": "EUR",
+        "AM": "AMD",
+        "AN": "ANG",
+        "AO": "AOA",
+        "AR": "ARS",
+        "AS": "USD",
+        "AT": "EUR",
+        "AU": "AUD",
+        "AW": "AWG",
+        "AZ": "AZN",
+        "BA": "BAM",
+        "BB": "BBD",
+        "BD": "BDT",
+        "BE": "EUR",
+        "BF": "XOF",
+        "BG": "BGN",
+        "BH": "BHD",
+        "BI": "BIF",
+        "BJ": "XOF",
+        "BM": "BMD",
+        "BN": "BND",
+        "BO": "BOB",
+        "BR": "BRL",
+        "BS": "BSD",
+        "BT": "BTN",
+        "BW": "BWP",
+        "BY": "BYN",
+        "BZ": "BZD",
+        "CA": "CAD",
+        "CD": "CDF",
+        "CF": "XAF",
+        "CG": "XAF",
+        "CH": "CHF",
+        "CI": "XOF",
+        "CK": "NZD",
+        "CL": "CLP",
+        "CM": "XAF",
+        "CN": "CNY",
+        "CO": "COP",
+        "CR": "CRC",
+        "CU": "CUC",
+        "CV": "CVE",
+        "CY": "EUR",
+        "CZ": "CZK",
+        "DE": "EUR",
+        "DJ": "DJF",
+        "DK": "DKK",
+        "DM": "XCD",
+        "DO": "DOP",
+        "DZ": "DZD",
+        "EC": "USD",
+        "EE": "EUR",
+        "EG": "EGP",
+        "ER": "ERN",
+        "ES": "EUR",
+        "ET": "ETB",
+        "FI": "EUR",
+        "FJ": "FJD",
+        "FK": "GBP",
+        "FM": "USD",
+        "FO": "DKK",
+        "FR": "EUR",
+        "GA": "XAF",
+        "GB": "GBP",
+        "GD": "XCD",
+        "GE": "GEL",
+        "GF": "EUR",
+        "GG": "GBP",
+        "GH": "GHS",
+        "GI": "GBP",
+        "GL": "DKK",
+        "GM": "GMD",
+        "GN": "GNF",
+        "GP": "EUR",
+        "GQ": "XAF",
+        "GR": "EUR",
+        "GT": "GTQ",
+        "GU": "USD",
+        "GW": "XOF",
+        "GY": "GYD",
+        "HK": "HKD",
+        "HN": "HNL",
+        "HR": "HRK",
+        "HT": "HTG",
+        "HU": "HUF",
+        "IC": "EUR",
+        "ID": "IDR",
+        "IE": "EUR",
+        "IL": "ILS",
+        "IN": "INR",
+        "IQ": "USD",
+        "IR": "IRR",
+        "IS": "ISK",
+        "IT": "EUR",
+        "JE": "GBP",
+        "JM": "JMD",
+        "JO": "JOD",
+        "JP": "JPY",
+        "KE": "KES",
+        "KG": "KGS",
+        "KH": "KHR",
+        "KI": "AUD",
+        "KM": "KMF",
+        "KN": "XCD",
+        "KP": "KPW",
+        "KR": "KRW",
+        "KV": "EUR",
+        "KW": "KWD",
+        "KY": "KYD",
+        "KZ": "KZT",
+        "LA": "LAK",
+        "LB": "USD",
+        "LC": "XCD",
+        "LI": "CHF",
+        "LK": "LKR",
+        "LR": "LRD",
+        "LS": "LSL",
+        "LT": "EUR",
+        "LU": "EUR",
+        "LV": "EUR",
+        "LY": "LYD",
+        "MA": "MAD",
+        "MC": "EUR",
+        "MD": "MDL",
+        "ME": "EUR",
+        "MG": "MGA",
+        "MH": "USD",
+        "MK": "MKD",
+        "ML": "XOF",
+        "MM": "MMK",
+        "MN": "MNT",
+        "MO": "MOP",
+        "MP": "USD",
+        "MQ": "EUR",
+        "MR": "MRO",
+        "MS": "XCD",
+        "MT": "EUR",
+        "MU": "MUR",
+        "MV": "MVR",
+        "MW": "MWK",
+        "MX": "MXN",
+        "MY": "MYR",
+        "MZ": "MZN",
+        "NA": "NAD",
+        "NC": "XPF",
+        "NE": "XOF",
+        "NG": "NGN",
+        "NI": "NIO",
+        "NL": "EUR",
+        "NO": "NOK",
+        "NP": "NPR",
+        "NR": "AUD",
+        "NU": "NZD",
+        "NZ": "NZD",
+        "OM": "OMR",
+        "PA": "USD",
+        "PE": "PEN",
+        "PF": "XPF",
+        "PG": "PGK",
+        "PH": "PHP",
+        "PK": "PKR",
+        "PL": "PLN",
+        "PR": "USD",
+        "PT": "EUR",
+        "PW": "USD",
+        "PY": "PYG",
+        "QA": "QAR",
+        "RE": "EUR",
+        "RO": "RON",
+        "RS": "RSD",
+        "RU": "RUB",
+        "RW": "RWF",
+        "SA": "SAR",
+        "SB": "SBD",
+        "SC": "SCR",
+        "SD": "SDG",
+        "SE": "SEK",
+        "SG": "SGD",
+        "SH": "SHP",
+        "SI": "EUR",
+        "SK": "EUR",
+        "SL": "SLL",
+        "SM": "EUR",
+        "SN": "XOF",
+        "SO": "SOS",
+        "SR": "SRD",
+        "SS": "SSP",
+        "ST": "STD",
+        "SV": "USD",
+        "SY": "SYP",
+        "SZ": "SZL",
+        "TC": "USD",
+        "TD": "XAF",
+        "TG": "XOF",
+        "TH": "THB",
+        "TJ": "TJS",
+        "TL": "USD",
+        "TN": "TND",
+        "TO": "TOP",
+        "TR": "TRY",
+        "TT": "TTD",
+        "TV": "AUD",
+        "TW": "TWD",
+        "TZ": "TZS",
+        "UA": "UAH",
+        "UG": "USD",
+        "US": "USD",
+        "UY": "UYU",
+        "UZ": "UZS",
+        "VA": "EUR",
+        "VC": "XCD",
+        "VE": "VEF",
+        "VG": "USD",
+        "VI": "USD",
+        "VN": "VND",
+        "VU": "VUV",
+        "WS": "WST",
+        "XB": "EUR",
+        "XC": "EUR",
+        "XE": "ANG",
+        "XM": "EUR",
+        "XN": "XCD",
+        "XS": "USD",
+        "XY": "ANG",
+        "YE": "YER",
+        "YT": "EUR",
+        "ZA": "ZAR",
+        "ZM": "ZMW",
+        "ZW": "USD",
+    }
+
+    @classmethod
+    def get(cls, country: str) -> Optional[str]:
+        return cls._CURRENCIES.get(country)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def enum(cls) -> Enum:
+        return Enum("CountryCurrency", cls._CURRENCIES)
+
+
+class CountryState:
+    """Country state code tables, materialized into Enums on demand."""
+
+    _STATES = {
+        "AE": {
+            "AB": "Abu Dhabi",
+            "AJ": "Ajman",
+            "DU": "Dubai",
+            "FU": "Fujairah",
+            "RA": "Ras al-Khaimah",
+            "SH": "Sharjah",
+            "UM": "Umm al-Qaiwain",
+        },
+        "CA": {
+            "AB": "Alberta",
+            "BC": "British Columbia",
+            "MB": "Manitoba",
+            "NB": "New Brunswick",
+            "NL": "Newfoundland",
+            "NT": "Northwest Territories",
+            "NS": "Nova Scotia",
+            "NU": "Nunavut",
+            "ON": "Ontario",
+            "PE": "Prince Edward Island",
+            "QC": "Quebec",
+            "SK": "Saskatchewan",
+            "YT": "Yukon",
+        },
+        "CN": {
+            "anhui": "Anhui",
+            "hainan": "Hainan",
+            "jiangxi": "Jiangxi",
+            "shanghai": "Shanghai",
+            "beijing": "Beijing",
+            "hebei": "Hebei",
+            "jilin": "Jilin",
+            "shanxi": "Shanxi",
+            "chongqing": "Chongqing",
+            "heilongjiang": "Heilongjiang",
+            "liaoning": "Liaoning",
+            "sichuan": "Sichuan",
+            "fujian": "Fujian",
+            "henan": "Henan",
+            "nei_mongol": "Nei Mongol",
+            "tianjin": "Tianjin",
+            "gansu": "Gansu",
+            "hubei": "Hubei",
+            "qinghai": "Qinghai",
+            "xinjiang": "Xinjiang",
+            "guangdong": "Guangdong",
+            "hunan": "Hunan",
+            "shaanxi": "Shaanxi",
+            "yunnan": "Yunnan",
+            "guizhou": "Guizhou",
+            "jiangsu": "Jiangsu",
+            "shandong": "Shandong",
+            "zhejiang": "Zhejiang",
+        },
+        "IN": {
+            "AN": "Andaman & Nicobar (U.T)",
+            "AP": "Andhra Pradesh",
+            "AR": "Arunachal Pradesh",
+            "AS": "Assam",
+            "BR": "Bihar",
+            "CG": "Chattisgarh",
+            "CH": "Chandigarh (U.T.)",
+            "DD": "Daman & Diu (U.T.)",
+            "DL": "Delhi (U.T.)",
+            "DN": "Dadra and Nagar Haveli (U.T.)",
+            "GA": "Goa",
+            "GJ": "Gujarat",
+            "HP": "Himachal Pradesh",
+            "HR": "Haryana",
+            "JH": "Jharkhand",
+            "JK": "Jammu & Kashmir",
+            "KA": "Karnataka",
+            "KL": "Kerala",
+            "LD": "Lakshadweep (U.T)",
+            "MH": "Maharashtra",
+            "ML": "Meghalaya",
+            "MN": "Manipur",
+            "MP": "Madhya Pradesh",
+            "MZ": "Mizoram",
+            "NL": "Nagaland",
+            "OR": "Orissa",
+            "PB": "Punjab",
+            "PY": "Puducherry (U.T.)",
+            "RJ": "Rajasthan",
+            "SK": "Sikkim",
+            "TN": "Tamil Nadu",
+            "TR": "Tripura",
+            "UA": "Uttaranchal",
+            "UP": "Uttar Pradesh",
+            "WB": "West Bengal",
+        },
+        "MX": {
+            "AG": "Aguascalientes",
+            "BC": "Baja California",
+            "BS": "Baja California Sur",
+            "CM": "Campeche",
+            "CS": "Chiapas",
+            "CH": "Chihuahua",
+            "CO": "Coahuila",
+            "CL": "Colima",
+            "DF": "Ciudad de México",
+            "DG": "Durango",
+            "GT": "Guanajuato",
+            "GR": "Guerrero",
+            "HG": "Hidalgo",
+            "JA": "Jalisco",
+            "EM": "Estado de México",
+            "MI": "Michoacán",
+            "MO": "Morelos",
+            "NA": "Nayarit",
+            "NL": "Nuevo León",
+            "OA": "Oaxaca",
+            "PU": "Puebla",
+            "QE": "Querétaro",
+            "QR": "Quintana Roo",
+            "SL": "San Luis Potosí",
+            "SI": "Sinaloa",
+            "SO": "Sonora",
+            "TB": "Tabasco",
+            "TM": "Tamaulipas",
+            "TL": "Tlaxcala",
+            "VE": "Veracruz",
+            "YU": "Yucatán",
+            "ZA": "Zacatecas",
+        },
+        "US": {
+            "AL": "Alabama",
+            "AK": "Alaska",
+            "AZ": "Arizona",
+            "AR": "Arkansas",
+            "CA": "California",
+            "CO": "Colorado",
+            "CT": "Connecticut",
+            "DE": "Delaware",
+            "DC": "District of Columbia",
+            "FL": "Florida",
+            "GA": "Georgia",
+            "HI": "Hawaii",
+            "ID": "Idaho",
+            "IL": "Illinois",
+            "IN": "Indiana",
+            "IA": "Iowa",
+            "KS": "Kansas",
+            "KY": "Kentucky",
+            "LA": "Louisiana",
+            "ME": "Maine",
+            "MD": "Maryland",
+            "MA": "Massachusetts",
+            "MI": "Michigan",
+            "MN": "Minnesota",
+            "MS": "Mississippi",
+            "MO": "Missouri",
+            "MT": "Montana",
+            "NE": "Nebraska",
+            "NV": "Nevada",
+            "NH": "New Hampshire",
+            "NJ": "New Jersey",
+            "NM": "New Mexico",
+            "NY": "New York",
+            "NC": "North Carolina",
+            "ND": "North Dakota",
+            "OH": "Ohio",
+            "OK": "Oklahoma",
+            "OR": "Oregon",
+            "PA": "Pennsylvania",
+            "RI": "Rhode Island",
+            "SC": "South Carolina",
+            "SD": "South Dakota",
+            "TN": "Tennessee",
+            "TX": "Texas",
+            "UT": "Utah",
+            "VT": "Vermont",
+            "VA": "Virginia",
+            "WA": "Washington State",
+            "WV": "West Virginia",
+            "WI": "Wisconsin",
+            "WY": "Wyoming",
+            "PR": "Puerto Rico",
+        },
+    }
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def states(cls, country: str) -> Enum:
+        return Enum("State", cls._STATES[country])
@@ -4,6 +4,8 @@ from typing import Union, Optional
 def decimal(value: Union[str, float] = None) -> Optional[float]:
     if value is None:
         return None
+    if value.__class__ is float:
+        return round(value, 2)
     return round(float(value), 2)
 
 
@@ -1,4 +1,9 @@
+import re
+import sys
+from copy import copy
+from functools import lru_cache, partial
 from typing import TypeVar, Type, Optional, cast
+from lxml.etree import QName
 from pysoap.envelope import Header, Body, Envelope, Fault
 from purplship.core.utils.xml import Element
 from purplship.core.settings import Settings
@@ -6,17 +11,31 @@ from purplship.core.models import Message
 
 T = TypeVar("T")
 
+_SOAP_BODY_TAGS = (
+    "{http://schemas.xmlsoap.org/soap/envelope/}Body",
+    "{http://www.w3.org/2003/05/soap-envelope}Body",
+)
+
 
 class GenerateDSAbstract:
     def build(self, *args):
         pass
 
 
+_DEFAULT_STATES: dict = {}
+
+
 def build(tp: Type[T], node: Element = None) -> Optional[T]:
     if node is None:
         return None
 
-    instance = tp()
+    defaults = _DEFAULT_STATES.get(tp)
+    if defaults is None:
+        defaults = _DEFAULT_STATES[tp] = tp().__dict__
+    instance = tp.__new__(tp)
+    instance.__dict__.update(
+        (key, copy(value)) for key, value in defaults.items()
+    )
     cast(GenerateDSAbstract, instance).build(node)
     return instance
 
@@ -36,22 +55,120 @@ def create_envelope(
         header_content.original_tagname_ = (
             header_tag_name or header_content.original_tagname_
         )
-        header = Header()
-        header.add_anytypeobjs_(header_content)
+        header = Header(anytypeobjs_=[header_content])
+        header.ns_prefix_ = envelope_prefix
 
     body_content.ns_prefix_ = body_prefix or body_content.ns_prefix_
     body_content.original_tagname_ = body_tag_name or body_content.original_tagname_
-    body = Body()
-    body.add_anytypeobjs_(body_content)
+    body = Body(anytypeobjs_=[body_content])
+    body.ns_prefix_ = envelope_prefix
 
     envelope = Envelope(Header=header, Body=body)
     envelope.ns_prefix_ = envelope_prefix
-    envelope.Body.ns_prefix_ = envelope.ns_prefix_
-    if envelope.Header is not None:
-        envelope.Header.ns_prefix_ = envelope.ns_prefix_
     return envelope
 
 
+@lru_cache(maxsize=None)
+def _clean_namespaces_pattern(
+    envelope_prefix: str, body_child_name: str, header_child_name: str
+):
+    names = sorted({body_child_name, header_child_name}, key=len, reverse=True)
+    return re.compile(
+        "(</?)%s(%s)"
+        % (re.escape(envelope_prefix), "|".join(re.escape(name) for name in names))
+    )
+
+
+_ENVELOPE_SKELETONS: dict = {}
+
+
+def create_envelope_cached(
+    body_content: Element,
+    header_content: Element = None,
+    header_prefix: str = None,
+    body_prefix: str = None,
+    header_tag_name: str = None,
+    body_tag_name: str = None,
+    envelope_prefix: str = "tns",
+) -> Envelope:
+    """create_envelope variant reusing the Envelope/Header/Body skeleton.
+
+    The skeleton is shared per (prefix, tag-name) profile: only the header
+    and body contents are swapped in on reuse. The returned envelope is NOT
+    reentrant — serialize it before building the next one with the same
+    profile.
+    """
+    key = (
+        envelope_prefix,
+        header_prefix,
+        body_prefix,
+        header_tag_name,
+        body_tag_name,
+        header_content is not None,
+    )
+    envelope = _ENVELOPE_SKELETONS.get(key)
+    if envelope is None:
+        envelope = _ENVELOPE_SKELETONS[key] = create_envelope(
+            body_content,
+            header_content,
+            header_prefix,
+            body_prefix,
+            header_tag_name,
+            body_tag_name,
+            envelope_prefix,
+        )
+        return envelope
+
+    if header_content is not None:
+        header_content.ns_prefix_ = header_prefix or header_content.ns_prefix_
+        header_content.original_tagname_ = (
+            header_tag_name or header_content.original_tagname_
+        )
+        envelope.Header.anytypeobjs_ = [header_content]
+
+    body_content.ns_prefix_ = body_prefix or body_content.ns_prefix_
+    body_content.original_tagname_ = body_tag_name or body_content.original_tagname_
+    envelope.Body.anytypeobjs_ = [body_content]
+    return envelope
+
+
+def make_envelope_builder(
+    *,
+    header_prefix: str = None,
+    body_prefix: str = None,
+    header_tag_name: str = None,
+    body_tag_name: str = None,
+    envelope_prefix: str = "tns",
+):
+    """Specialize create_envelope for a carrier's fixed prefix/tag arguments.
+
+    Carrier modules call create_envelope with the same prefixes and tag
+    names on every request; baking them into a closure at import time
+    leaves only the varying contents to handle per call.
+    """
+
+    def build_envelope(body_content: Element, header_content: Element = None) -> Envelope:
+        header = None
+        if header_content is not None:
+            header_content.ns_prefix_ = header_prefix or header_content.ns_prefix_
+            header_content.original_tagname_ = (
+                header_tag_name or header_content.original_tagname_
+            )
+            header = Header(anytypeobjs_=[header_content])
+            header.ns_prefix_ = envelope_prefix
+
+        body_content.ns_prefix_ = body_prefix or body_content.ns_prefix_
+        body_content.original_tagname_ = body_tag_name or body_content.original_tagname_
+        body = Body(anytypeobjs_=[body_content])
+        body.ns_prefix_ = envelope_prefix
+
+        envelope = Envelope(Header=header, Body=body)
+        envelope.ns_prefix_ = envelope_prefix
+        return envelope
+
+    return build_envelope
+
+
 def clean_namespaces(
     envelope_str: str,
     envelope_prefix: str,
@@ -60,44 +177,72 @@ def clean_namespaces(
     header_child_prefix: str = "",
     body_child_prefix: str = "",
 ):
-    return (
-        envelope_str.replace(
-            "<%s%s" % (envelope_prefix, header_child_name),
-            "<%s%s" % (header_child_prefix, header_child_name),
-        )
-        .replace(
-            "</%s%s" % (envelope_prefix, header_child_name),
-            "</%s%s" % (header_child_prefix, header_child_name),
-        )
-        .replace(
-            "<%s%s" % (envelope_prefix, body_child_name),
-            "<%s%s" % (body_child_prefix, body_child_name),
-        )
-        .replace(
-            "</%s%s" % (envelope_prefix, body_child_name),
-            "</%s%s" % (body_child_prefix, body_child_name),
-        )
+    prefixes = {
+        body_child_name: body_child_prefix,
+        header_child_name: header_child_prefix,
+    }
+    pattern = _clean_namespaces_pattern(
+        envelope_prefix, body_child_name, header_child_name
     )
+    return pattern.sub(
+        lambda match: match.group(1) + prefixes[match.group(2)] + match.group(2),
+        envelope_str,
+    )
+
+
+_FIELD_CACHE: dict = {}
+_HAS_EXPORT: dict = {}
+_NSPREFIX_KEYS: dict = {}
+
+
+def _nsprefix_key(name: str) -> str:
+    key = _NSPREFIX_KEYS.get(name)
+    if key is None:
+        key = _NSPREFIX_KEYS[name] = sys.intern(name + '_nsprefix_')
+    return key
 
 
 def apply_namespaceprefix(item, prefix: str):
-    if isinstance(item, list):
-        [apply_namespaceprefix(child, prefix) for child in item]
-    elif hasattr(item, 'export'):
-        item.ns_prefix_ = prefix
-        children = [(k, v) for k, v in item.__dict__.items() if '_' not in k and v is not None]
-        for name, child in children:
-            setattr(item, f'{name}_nsprefix_', prefix)
-            apply_namespaceprefix(child, prefix)
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+            continue
+
+        tp = item.__class__
+        exportable = _HAS_EXPORT.get(tp)
+        if exportable is None:
+            exportable = _HAS_EXPORT[tp] = getattr(tp, 'export', None) is not None
+        if exportable:
+            item.ns_prefix_ = prefix
+            d = item.__dict__
+            fields = _FIELD_CACHE.get(tp)
+            if fields is None:
+                fields = _FIELD_CACHE[tp] = tuple(k for k in d if '_' not in k)
+            for name in fields:
+                child = d.get(name)
+                if child is None:
+                    continue
+                d[_nsprefix_key(name)] = prefix
+                stack.append(child)
+
+
+@lru_cache(maxsize=None)
+def _message_factory(carrier_name: str, carrier_id: str):
+    return partial(Message, carrier_name=carrier_name, carrier_id=carrier_id)
 
 
 def extract_fault(response: Element, settings: Type[Settings]) -> Message:
-    faults = [build(Fault, node) for node in response.xpath(".//*[local-name() = $name]", name="Fault")]
+    body = next(
+        (node for tag in _SOAP_BODY_TAGS for node in [response.find(tag)] if node is not None),
+        None,
+    )
+    if body is not None and (len(body) == 0 or QName(body[0]).localname != "Fault"):
+        return []
+
+    faults = [build(Fault, node) for node in response.iter("{*}Fault")]
+    message = _message_factory(settings.carrier_name, settings.carrier_id)
     return [
-        Message(
-            code=fault.faultcode,
-            message=fault.faultstring,
-            carrier_name=settings.carrier_name,
-            carrier_id=settings.carrier_id
-        ) for fault in faults
+        message(code=fault.faultcode, message=fault.faultstring) for fault in faults
     ]